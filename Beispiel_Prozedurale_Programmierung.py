@@ -0,0 +1,36 @@
+"""Beispiel fuer prozedurale Programmierung: Schaltjahrberechnung."""
+
+import numpy as np
+
+
+def Berechne_ob_Schaltjahr(jahr: int) -> bool:
+    """Klassische, verzweigte Variante fuer die interaktive Abfrage."""
+    if jahr % 4 != 0:
+        return False
+    elif jahr % 100 != 0:
+        return True
+    elif jahr % 400 != 0:
+        return False
+    else:
+        return True
+
+
+def is_leap(y):
+    """Branchless leap-year test for a scalar or an array of years.
+
+    ``y & 3`` is the bit test for divisibility by 4; the whole
+    expression is pure boolean arithmetic, so it vectorizes over an
+    ``np.ndarray`` without Python-level branches.
+    """
+    return ((y & 3) == 0) & ((y % 100 != 0) | (y % 400 == 0))
+
+
+if __name__ == "__main__":
+    jahr = int(input("Jahr eingeben: "))
+    if Berechne_ob_Schaltjahr(jahr):
+        print(f"{jahr} ist ein Schaltjahr.")
+    else:
+        print(f"{jahr} ist kein Schaltjahr.")
+
+    jahre = np.arange(2000, 2101)
+    print(f"Schaltjahre bis 2100: {jahre[is_leap(jahre)]}")
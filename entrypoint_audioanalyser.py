@@ -0,0 +1,43 @@
+"""Analyse one machining recording end to end.
+
+Usage:
+    python entrypoint_audioanalyser.py rec.wav
+"""
+
+import sys
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from gcaudiosync.audioanalyser.recordings import (
+    LazyProcessedRecording,
+    PreprocessedRecording,
+    RawRecording,
+)
+from gcaudiosync.audioanalyser.visualize import spectrogram
+
+
+def main() -> None:
+    file = Path(sys.argv[1])
+    raw = RawRecording.from_file(file)
+    ppr = PreprocessedRecording.from_raw(raw).filter_out_silence()
+    pr = LazyProcessedRecording(ppr.samplerate, ppr.data)
+
+    smoothed = pr.abc_filter()
+    fundamentals = pr.harmonic_filtered_dominant_freq()
+
+    duration = len(ppr.data) / ppr.samplerate
+    fig, ax = plt.subplots(figsize=(14, 8))
+    spectrogram(pr.S_db, (0.0, duration, 0.0, ppr.samplerate / 2.0), ax)
+    times = np.linspace(0.0, duration, len(fundamentals))
+    ax.plot(times, smoothed, color="cyan", linewidth=0.8, label="abc filter")
+    ax.plot(
+        times, fundamentals, color="white", linewidth=0.8, label="fundamental"
+    )
+    ax.legend()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
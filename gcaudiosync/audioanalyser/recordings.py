@@ -0,0 +1,222 @@
+"""Recording containers for the audio analyser.
+
+The pipeline is ``RawRecording`` (samples as read from disk) ->
+``PreprocessedRecording`` (silence removed) -> ``ProcessedRecording`` /
+``LazyProcessedRecording`` (short-time spectra).  The eager variant
+computes everything up front; the lazy variant recomputes on demand and
+is the one used by the analysis entry points.
+"""
+
+import functools
+import os
+
+import numpy as np
+from scipy.io import wavfile
+
+try:  # pyfftw is optional: FFTW plans + SIMD kernels, 2-3x over np.fft
+    import pyfftw
+
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+
+    def _rfft(frames: np.ndarray, axis: int) -> np.ndarray:
+        # threads= parallelizes across the (independent) frames.
+        return pyfftw.interfaces.numpy_fft.rfft(
+            frames, axis=axis, threads=os.cpu_count()
+        )
+
+except ImportError:
+
+    def _rfft(frames: np.ndarray, axis: int) -> np.ndarray:
+        return np.fft.rfft(frames, axis=axis)
+
+# Floor added before the log so silent bins do not produce -inf.
+_DB_EPS = 1e-12
+
+
+@functools.lru_cache(maxsize=32)
+def _hann(n: int) -> np.ndarray:
+    """Hann window of length ``n``, shared across recordings.
+
+    Batch runs create one recording per file with the same window
+    length; the cache hands every instance the same read-only array.
+    """
+    window = 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(n) / n)
+    window.setflags(write=False)
+    return window
+
+
+class RawRecording:
+    """Audio samples exactly as read from the WAV file."""
+
+    def __init__(self, samplerate: int, data: np.ndarray) -> None:
+        self.samplerate: int = samplerate
+        self.data: np.ndarray = data
+
+    @classmethod
+    def from_file(cls, file_path) -> "RawRecording":
+        # Memory-mapped: pages are faulted in as the (sequential) STFT
+        # streams across the frames, so opening is instant and long
+        # recordings never sit fully in RAM. Callers must not mutate.
+        samplerate, data = wavfile.read(file_path, mmap=True)
+        if data.ndim > 1:  # stereo: analyse the first channel
+            data = data[:, 0]
+        return cls(samplerate, data)
+
+
+class PreprocessedRecording:
+    """Recording with the silent stretches removed."""
+
+    def __init__(self, samplerate: int, data: np.ndarray) -> None:
+        self.samplerate: int = samplerate
+        self.data: np.ndarray = data
+
+    @classmethod
+    def from_raw(cls, raw: RawRecording) -> "PreprocessedRecording":
+        return cls(raw.samplerate, raw.data)
+
+    def filter_out_silence(
+        self, threshold: float = 0.01, window: int = 2048
+    ) -> "PreprocessedRecording":
+        """Drop every window whose peak amplitude stays below
+        ``threshold`` (relative to the overall peak)."""
+        data = self.data
+        peak = float(np.abs(data).max())
+        if peak == 0.0:
+            return PreprocessedRecording(self.samplerate, data)
+        limit = threshold * peak
+        # Collect the kept views first and concatenate once at the end;
+        # growing an array per chunk re-copies everything already kept.
+        kept_chunks = [
+            data[start : start + window]
+            for start in range(0, len(data), window)
+            if np.abs(data[start : start + window]).max() >= limit
+        ]
+        if not kept_chunks:
+            return PreprocessedRecording(self.samplerate, data[:0].copy())
+        return PreprocessedRecording(
+            self.samplerate, np.concatenate(kept_chunks)
+        )
+
+
+class ProcessedRecording:
+    """Eagerly computed short-time spectrum of a recording."""
+
+    def __init__(
+        self,
+        samplerate: int,
+        S_db: np.ndarray,
+        n_fft: int,
+        hop: int,
+    ) -> None:
+        self.samplerate: int = samplerate
+        self.S_db: np.ndarray = S_db
+        self.n_fft: int = n_fft
+        self.hop: int = hop
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw: RawRecording | PreprocessedRecording,
+        n_fft: int = 2048,
+        hop: int = 512,
+    ) -> "ProcessedRecording":
+        lazy = LazyProcessedRecording(raw.samplerate, raw.data, n_fft, hop)
+        S = lazy.S
+        # 20*log10(|z|) == 10*log10(z.re^2 + z.im^2): the power spectrum
+        # skips the sqrt pass hidden in np.abs.
+        mag_sq = S.real**2 + S.imag**2
+        S_db = 10.0 * np.log10(mag_sq + _DB_EPS)
+        # Free the complex buffer (and its cache on the helper) before
+        # returning; only the dB matrix is kept.
+        del S, lazy
+        return cls(raw.samplerate, S_db, n_fft, hop)
+
+
+class LazyProcessedRecording:
+    """Short-time spectra computed on demand from the samples."""
+
+    def __init__(
+        self,
+        samplerate: int,
+        data: np.ndarray,
+        n_fft: int = 2048,
+        hop: int = 512,
+        window: str = "hann",
+    ) -> None:
+        self.samplerate: int = samplerate
+        self.data: np.ndarray = data
+        self.n_fft: int = n_fft
+        self.hop: int = hop
+        self.window: str = window
+
+    def _frames(self) -> np.ndarray:
+        """Windowed analysis frames, one per row.
+
+        ``sliding_window_view`` is a zero-copy strided view and the hop
+        is a slice of it, so only the window multiply materializes — a
+        boxcar window skips even that.
+        """
+        view = np.lib.stride_tricks.sliding_window_view(
+            self.data, self.n_fft
+        )[:: self.hop]
+        if self.window == "boxcar":
+            return view
+        return view * _hann(self.n_fft)
+
+    @functools.cached_property
+    def S(self) -> np.ndarray:
+        """Complex spectrum, shape (frequency bins, frames).
+
+        Cached: every spectral product downstream derives from this one
+        STFT, which would otherwise rerun per accessor call.
+        """
+        return _rfft(self._frames(), axis=1).T
+
+    @functools.cached_property
+    def S_db(self) -> np.ndarray:
+        """Magnitude spectrum in dB."""
+        # As in the eager variant: 10*log10 of the power spectrum skips
+        # the sqrt pass that np.abs would run over every bin.
+        S = self.S
+        power = S.real**2 + S.imag**2
+        return 10.0 * np.log10(power + _DB_EPS)
+
+    @functools.cached_property
+    def frequencies(self) -> np.ndarray:
+        """Center frequency of every spectrum row [Hz]."""
+        return np.fft.rfftfreq(self.n_fft, 1.0 / self.samplerate)
+
+    @functools.cached_property
+    def dominant_freq(self) -> np.ndarray:
+        """Strongest frequency per frame [Hz]."""
+        return self.frequencies[np.argmax(self.S_db, axis=0)]
+
+    def abc_filter(
+        self, a: float = 0.25, b: float = 0.5, c: float = 0.25
+    ) -> np.ndarray:
+        """Three-point smoothing of the per-frame dominant frequency."""
+        dominant = self.dominant_freq
+        smoothed = dominant.copy()
+        smoothed[1:-1] = a * dominant[:-2] + b * dominant[1:-1] + c * dominant[2:]
+        return smoothed
+
+    def harmonic_filtered_dominant_freq(
+        self, max_harmonic: int = 4, tolerance: float = 0.05
+    ) -> np.ndarray:
+        """Dominant frequency folded down onto its fundamental.
+
+        A frame whose peak sits within ``tolerance`` of an integer
+        multiple of the running median is divided down to the
+        fundamental, which suppresses octave jumps of the argmax.
+        """
+        dominant = self.dominant_freq
+        base = float(np.median(dominant[dominant > 0.0])) if dominant.any() else 0.0
+        if base == 0.0:
+            return dominant
+        folded = dominant.copy()
+        for harmonic in range(2, max_harmonic + 1):
+            ratio = folded / (harmonic * base)
+            near = np.abs(ratio - 1.0) <= tolerance
+            folded[near] /= harmonic
+        return folded
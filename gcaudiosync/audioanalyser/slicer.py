@@ -0,0 +1,24 @@
+"""Frequency-axis slicing of spectrogram matrices."""
+
+import numpy as np
+
+
+class Slicer:
+    """Maps frequency bounds in Hz onto spectrogram row ranges."""
+
+    def __init__(self, samplerate: int, n_fft: int) -> None:
+        self.frequencies: np.ndarray = np.fft.rfftfreq(
+            n_fft, 1.0 / samplerate
+        )
+
+    def matrix_slice(
+        self, S: np.ndarray, hz_bound: tuple[float, float]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rows of ``S`` within ``hz_bound``, as views.
+
+        Returns ``(S_slice, frequencies_slice)``.
+        """
+        low, high = hz_bound
+        start = int(np.searchsorted(self.frequencies, low))
+        stop = int(np.searchsorted(self.frequencies, high, side="right"))
+        return S[start:stop], self.frequencies[start:stop]
@@ -0,0 +1,18 @@
+"""Plot helpers for the audio analyser."""
+
+
+def spectrogram(S, extent, ax):
+    """Draw the spectrogram matrix ``S`` onto ``ax``.
+
+    ``extent`` is ``(t_min, t_max, hz_min, hz_max)``.
+    """
+    ax.imshow(
+        S,
+        origin="lower",
+        aspect="auto",
+        extent=extent,
+        cmap="magma",
+    )
+    ax.set_xlabel("Time [s]")
+    ax.set_ylabel("Frequency [Hz]")
+    return ax
@@ -0,0 +1,165 @@
+"""Numba-compiled interpolation kernels for the movement timeline.
+
+Numba is an optional dependency; :mod:`movementmanager` falls back to
+the pure-NumPy batch path when this module cannot be imported.  The
+compiled machine code is cached on disk (``cache=True``) because a cold
+recompile takes seconds.
+
+The parallel variant uses Numba's threading layer (select with
+``NUMBA_THREADING_LAYER=omp`` or ``tbb``); below ``PARALLEL_THRESHOLD``
+frames the serial kernel avoids the thread-pool startup latency.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Below this many query times the thread-pool startup costs more than
+# the parallel fill saves.
+PARALLEL_THRESHOLD = 4096
+
+
+@njit(cache=True)
+def push(buf, head, val):
+    """Store ``val`` at ``head`` of a ring buffer, return the next head."""
+    buf[head] = val
+    return (head + 1) % buf.shape[0]
+
+
+@njit(cache=True, fastmath=True)
+def _eval_one(
+    i,
+    t,
+    seg_t1,
+    seg_t0,
+    seg_duration,
+    seg_type,
+    seg_start,
+    seg_delta,
+    seg_cx,
+    seg_cy,
+    seg_r,
+    seg_theta0,
+    seg_dtheta,
+    seg_line,
+    out_xyz,
+    out_idx,
+    out_mtype,
+):
+    n_segments = seg_t0.shape[0]
+
+    # bisect_left on the sorted end times.
+    lo = 0
+    hi = n_segments
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if seg_t1[mid] < t:
+            lo = mid + 1
+        else:
+            hi = mid
+    k = lo
+    if k >= n_segments:
+        k = n_segments - 1
+
+    duration = seg_duration[k]
+    if duration > 0.0:
+        fraction = (t - seg_t0[k]) / duration
+    else:
+        fraction = 1.0
+
+    movement_type = seg_type[k]
+    if movement_type >= 2:
+        angle = seg_theta0[k] + fraction * seg_dtheta[k]
+        out_xyz[i, 0] = seg_cx[k] + seg_r[k] * np.cos(angle)
+        out_xyz[i, 1] = seg_cy[k] + seg_r[k] * np.sin(angle)
+    else:
+        out_xyz[i, 0] = seg_start[k, 0] + fraction * seg_delta[k, 0]
+        out_xyz[i, 1] = seg_start[k, 1] + fraction * seg_delta[k, 1]
+    out_xyz[i, 2] = seg_start[k, 2] + fraction * seg_delta[k, 2]
+
+    out_idx[i] = seg_line[k]
+    out_mtype[i] = movement_type
+
+
+@njit(cache=True, fastmath=True)
+def eval_positions(
+    times,
+    seg_t1,
+    seg_t0,
+    seg_duration,
+    seg_type,
+    seg_start,
+    seg_delta,
+    seg_cx,
+    seg_cy,
+    seg_r,
+    seg_theta0,
+    seg_dtheta,
+    seg_line,
+    out_xyz,
+    out_idx,
+    out_mtype,
+):
+    """Fill the output arrays with positions for every query time."""
+    for i in range(times.shape[0]):
+        _eval_one(
+            i,
+            times[i],
+            seg_t1,
+            seg_t0,
+            seg_duration,
+            seg_type,
+            seg_start,
+            seg_delta,
+            seg_cx,
+            seg_cy,
+            seg_r,
+            seg_theta0,
+            seg_dtheta,
+            seg_line,
+            out_xyz,
+            out_idx,
+            out_mtype,
+        )
+
+
+@njit(cache=True, fastmath=True, parallel=True, boundscheck=False)
+def eval_positions_parallel(
+    times,
+    seg_t1,
+    seg_t0,
+    seg_duration,
+    seg_type,
+    seg_start,
+    seg_delta,
+    seg_cx,
+    seg_cy,
+    seg_r,
+    seg_theta0,
+    seg_dtheta,
+    seg_line,
+    out_xyz,
+    out_idx,
+    out_mtype,
+):
+    """Parallel fill: segment lookup is read-only and every output row
+    is independent, so there are no races across ``prange``."""
+    for i in prange(times.shape[0]):
+        _eval_one(
+            i,
+            times[i],
+            seg_t1,
+            seg_t0,
+            seg_duration,
+            seg_type,
+            seg_start,
+            seg_delta,
+            seg_cx,
+            seg_cy,
+            seg_r,
+            seg_theta0,
+            seg_dtheta,
+            seg_line,
+            out_xyz,
+            out_idx,
+            out_mtype,
+        )
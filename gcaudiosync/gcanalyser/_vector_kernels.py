@@ -0,0 +1,81 @@
+"""Numba-compiled scalar vector kernels.
+
+Numba is an optional dependency; :mod:`vectorfunctions` falls back to
+its pure-Python implementations when this module cannot be imported.
+The explicit signatures make the on-disk cache (``cache=True``) valid
+immediately instead of after a first-call type inference pass.
+
+The arithmetic is written flat on purpose: Numba lowers ``np.dot`` and
+``np.cross`` poorly for length-2/3 arrays, while plain loops compile to
+a handful of machine instructions.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+@njit("float64[::1](float64[::1])", cache=True, fastmath=True)
+def normalize(vec):
+    norm_sq = 0.0
+    for i in range(vec.shape[0]):
+        norm_sq += vec[i] * vec[i]
+    out = vec.copy()
+    if norm_sq != 0.0:
+        scale = 1.0 / math.sqrt(norm_sq)
+        for i in range(out.shape[0]):
+            out[i] *= scale
+    return out
+
+
+@njit("float64(float64[::1], float64[::1])", cache=True, fastmath=True)
+def smaller_angle_deg(vec_1, vec_2):
+    dot = 0.0
+    norm_sq_1 = 0.0
+    norm_sq_2 = 0.0
+    for i in range(vec_1.shape[0]):
+        dot += vec_1[i] * vec_2[i]
+        norm_sq_1 += vec_1[i] * vec_1[i]
+        norm_sq_2 += vec_2[i] * vec_2[i]
+    cosine = dot / math.sqrt(norm_sq_1 * norm_sq_2)
+    if cosine > 1.0:
+        cosine = 1.0
+    elif cosine < -1.0:
+        cosine = -1.0
+    return math.degrees(math.acos(cosine))
+
+
+@njit(
+    "float64[::1](float64[::1], float64[::1], float64)",
+    cache=True,
+    fastmath=True,
+)
+def normal_vector(vec_1, vec_2, sign):
+    nx = vec_1[1] * vec_2[2] - vec_1[2] * vec_2[1]
+    ny = vec_1[2] * vec_2[0] - vec_1[0] * vec_2[2]
+    nz = vec_1[0] * vec_2[1] - vec_1[1] * vec_2[0]
+    length = math.sqrt(nx * nx + ny * ny + nz * nz)
+    if length == 0.0:
+        raise Exception("Vectors are parallel.")
+    scale = sign / length
+    out = np.empty(3)
+    out[0] = nx * scale
+    out[1] = ny * scale
+    out[2] = nz * scale
+    return out
+
+
+@njit(
+    "float64[::1](float64[::1], float64[::1], float64)",
+    cache=True,
+    fastmath=True,
+)
+def rotate_2d(center_2_point, center, angle_deg):
+    radians = math.radians(angle_deg)
+    cos_a = math.cos(radians)
+    sin_a = math.sin(radians)
+    out = np.empty(2)
+    out[0] = cos_a * center_2_point[0] - sin_a * center_2_point[1] + center[0]
+    out[1] = sin_a * center_2_point[0] + cos_a * center_2_point[1] + center[1]
+    return out
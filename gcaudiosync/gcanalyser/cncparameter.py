@@ -0,0 +1,23 @@
+"""Machine parameters of the CNC mill the G-code programs run on."""
+
+
+class CNCParameter:
+    """Static description of the machine tool.
+
+    All values describe the machine the recordings were made on and are
+    read-only as far as the analyser is concerned.
+    """
+
+    # Spindle speed limits [rev/min].
+    S_MAX: int = 12000
+    S_MIN: int = 0
+
+    # Whether S words in the G-code are absolute spindle speeds
+    # [rev/min] or a percentage of S_MAX.
+    S_IS_ABSOLUTE: bool = True
+
+    # Feed rate limit [mm/min].
+    F_MAX: float = 20000.0
+
+    # Time a tool change takes [ms].
+    TOOL_CHANGE_TIME: int = 8000
@@ -0,0 +1,47 @@
+"""Mutable machine state while stepping through a G-code program."""
+
+import numpy as np
+
+from gcaudiosync.gcanalyser.cncparameter import CNCParameter
+
+
+class CNCStatus:
+    """Snapshot of the machine state after a G-code line was executed.
+
+    One instance is carried through the program line by line; the
+    ``new_*`` methods apply the words found in the current line.
+    """
+
+    def __init__(self, start_position: np.ndarray | None = None) -> None:
+        if start_position is None:
+            start_position = np.zeros(3)
+        self.position_linear_axes: np.ndarray = start_position
+
+        self.F_value: float = 0.0
+
+        # Commanded spindle speed [rev/min] and the resulting
+        # rotation frequency [rev/s].
+        self.S_value: int = 0
+        self.spindle_frequency: int = 0
+        self.spindle_on: bool = False
+
+        self.active_g_code_line_index: int = 0
+
+    def new_F(self, new_F_value: float) -> None:
+        """Apply an F word, clamped to the machine limit."""
+        self.F_value = min(new_F_value, CNCParameter.F_MAX)
+
+    def new_S(self, new_S_value: int) -> None:
+        """Apply an S word.
+
+        Relative S words (percent of ``S_MAX``) are converted to an
+        absolute spindle speed first.
+        """
+        if not CNCParameter.S_IS_ABSOLUTE:
+            new_S_value = (CNCParameter.S_MAX * int(new_S_value)) // 100
+
+        if new_S_value > CNCParameter.S_MAX:
+            new_S_value = CNCParameter.S_MAX
+
+        self.S_value = new_S_value
+        self.spindle_frequency = int(new_S_value) // 60
@@ -0,0 +1,20 @@
+"""Small file helpers shared by the G-code analyser."""
+
+from pathlib import Path
+
+
+def read_cnc_file(src_path: str | Path) -> list[str]:
+    """Read a G-code file and return its lines.
+
+    The list is prefixed with a blank line so that the 1-based G-code
+    line numbers map directly onto list indices.
+    """
+    try:
+        with open(src_path) as file:
+            # extend() consumes the line iterator directly; readlines()
+            # plus list concatenation would build the full list twice.
+            lines = ["\n"]
+            lines.extend(file)
+            return lines
+    except FileNotFoundError:
+        raise Exception(f"File {src_path} not found.")
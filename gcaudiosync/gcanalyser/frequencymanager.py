@@ -0,0 +1,148 @@
+"""Spindle-frequency bookkeeping for the G-code analyser.
+
+The manager collects every spindle frequency, pause and snapshot the
+program commands while the analyser walks through the G-code.  Once the
+movement timeline is known, :meth:`FrequencyManager.update` maps the
+collected G-code line indices onto machining times.
+"""
+
+import bisect
+
+import numpy as np
+
+# Below this many time stamps the ndarray round-trip costs more than it
+# saves; fall back to ``bisect`` on a plain list.
+_NUMPY_THRESHOLD = 256
+
+
+class FrequencyInformation:
+    """One continuous spindle-frequency interval in the program."""
+
+    def __init__(
+        self,
+        S_value: int,
+        g_code_line_index_start: int,
+        g_code_line_index_end: int,
+    ) -> None:
+        self.S_value: int = S_value
+        self.frequency: int = int(S_value) // 60
+        self.g_code_line_index_start: int = g_code_line_index_start
+        self.g_code_line_index_end: int = g_code_line_index_end
+
+        # Filled in by FrequencyManager.update() [ms].
+        self.start_time: float = 0.0
+        self.end_time: float = 0.0
+
+
+class PauseInformation:
+    """A dwell or program stop at a single G-code line."""
+
+    def __init__(self, g_code_line_index: int, duration: float) -> None:
+        self.g_code_line_index: int = g_code_line_index
+        self.duration: float = duration
+
+        # Filled in by FrequencyManager.update() [ms].
+        self.start_time: float = 0.0
+
+
+class SnapshotInformation:
+    """Spindle state captured at a single G-code line."""
+
+    def __init__(self, S_value: int, g_code_line_index: int) -> None:
+        self.S_value: int = S_value
+        self.frequency: int = int(S_value) // 60
+        self.g_code_line_index: int = g_code_line_index
+
+        # Filled in by FrequencyManager.update() [ms].
+        self.time: float = 0.0
+
+
+class FrequencyManager:
+    """Tracks spindle frequencies and maps them onto the time line."""
+
+    def __init__(self) -> None:
+        self.frequencies: list[FrequencyInformation] = []
+        self.pauses: list[PauseInformation] = []
+        self.snapshots: list[SnapshotInformation] = []
+
+    def new_frequency(
+        self,
+        S_value: int,
+        g_code_line_index_start: int,
+        g_code_line_index_end: int,
+    ) -> None:
+        self.frequencies.append(
+            FrequencyInformation(
+                S_value, g_code_line_index_start, g_code_line_index_end
+            )
+        )
+
+    def new_pause(self, g_code_line_index: int, duration: float) -> None:
+        self.pauses.append(PauseInformation(g_code_line_index, duration))
+
+    def new_snapshot(self, S_value: int, g_code_line_index: int) -> None:
+        self.snapshots.append(SnapshotInformation(S_value, g_code_line_index))
+
+    def update(self, time_stamps: list[tuple[int, float]]) -> None:
+        """Assign start and end times from the movement timeline.
+
+        ``time_stamps`` is a list of ``(g_code_line_index, time_ms)``
+        tuples sorted by line index.  Small lists are resolved with
+        ``bisect`` on a precomputed key list (pure C, no array
+        allocation); large ones go through one batched
+        ``np.searchsorted`` call.
+        """
+        if not time_stamps:
+            return
+        if len(time_stamps) >= _NUMPY_THRESHOLD:
+            self._update_numpy(time_stamps)
+        else:
+            self._update_bisect(time_stamps)
+
+    def _update_bisect(self, time_stamps: list[tuple[int, float]]) -> None:
+        line_keys = [stamp[0] for stamp in time_stamps]
+        last = len(time_stamps) - 1
+
+        for frequency in self.frequencies:
+            i0 = bisect.bisect_left(
+                line_keys, frequency.g_code_line_index_start
+            )
+            frequency.start_time = time_stamps[min(i0, last)][1]
+            i1 = bisect.bisect_left(line_keys, frequency.g_code_line_index_end)
+            frequency.end_time = time_stamps[min(i1, last)][1]
+
+        for pause in self.pauses:
+            i = bisect.bisect_left(line_keys, pause.g_code_line_index)
+            pause.start_time = time_stamps[min(i, last)][1]
+
+        for snapshot in self.snapshots:
+            i = bisect.bisect_left(line_keys, snapshot.g_code_line_index)
+            snapshot.time = time_stamps[min(i, last)][1]
+
+    def _update_numpy(self, time_stamps: list[tuple[int, float]]) -> None:
+        line_keys = np.array([stamp[0] for stamp in time_stamps])
+        times = np.array([stamp[1] for stamp in time_stamps])
+        last = len(time_stamps) - 1
+
+        def _lookup(indices: list[int]) -> np.ndarray:
+            positions = np.searchsorted(line_keys, indices)
+            return times[np.minimum(positions, last)]
+
+        if self.frequencies:
+            starts = _lookup(
+                [f.g_code_line_index_start for f in self.frequencies]
+            )
+            ends = _lookup([f.g_code_line_index_end for f in self.frequencies])
+            for frequency, start, end in zip(self.frequencies, starts, ends):
+                frequency.start_time = float(start)
+                frequency.end_time = float(end)
+
+        if self.pauses:
+            starts = _lookup([p.g_code_line_index for p in self.pauses])
+            for pause, start in zip(self.pauses, starts):
+                pause.start_time = float(start)
+
+        if self.snapshots:
+            stamps = _lookup([s.g_code_line_index for s in self.snapshots])
+            for snapshot, stamp in zip(self.snapshots, stamps):
+                snapshot.time = float(stamp)
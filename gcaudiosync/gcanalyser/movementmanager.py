@@ -0,0 +1,262 @@
+"""Movement timeline of a G-code program.
+
+The analyser turns every executed G-code line into a :class:`Movement`
+with a start time and a duration.  The :class:`MovementManager` owns the
+resulting timeline and answers "where is the tool at time t" queries for
+the tool-path animation and the audio synchronisation.
+"""
+
+import bisect
+import math
+
+import numpy as np
+
+try:
+    from gcaudiosync.gcanalyser import _toolpath_kernels
+except ImportError:  # numba not installed
+    _toolpath_kernels = None
+
+
+class ToolPathInformation:
+    """Position and G-code context of the tool at one point in time."""
+
+    def __init__(self) -> None:
+        self.g_code_line_index: int = 0
+        self.movement_type: int = 0
+        # A tuple default is far cheaper to build than np.zeros(3); the
+        # attribute is replaced by an ndarray once a position is known,
+        # and both unpack/index the same way for consumers.
+        self.position_linear_axes: tuple[float, float, float] | np.ndarray = (
+            0.0,
+            0.0,
+            0.0,
+        )
+
+
+class Movement:
+    """One executed movement (G0/G1/G2/G3) with its timing.
+
+    Movement types: 0 = rapid, 1 = linear, 2 = arc clockwise,
+    3 = arc counterclockwise, -1 = pause.
+    """
+
+    def __init__(
+        self,
+        g_code_line_index: int,
+        movement_type: int,
+        start_position_linear_axes: np.ndarray,
+        end_position_linear_axes: np.ndarray,
+        start_time: float,
+        duration: float,
+        arc_center: np.ndarray | None = None,
+    ) -> None:
+        self.g_code_line_index: int = g_code_line_index
+        self.movement_type: int = movement_type
+        self.start_position_linear_axes: np.ndarray = start_position_linear_axes
+        self.end_position_linear_axes: np.ndarray = end_position_linear_axes
+        self.start_time: float = start_time
+        self.duration: float = duration
+        self.arc_center: np.ndarray | None = arc_center
+
+        # Arc geometry in the XY plane, precomputed once.
+        self.radius: float = 0.0
+        self.start_angle: float = 0.0
+        self.delta_angle: float = 0.0
+        if movement_type in (2, 3):
+            if arc_center is None:
+                raise Exception("Arc movement without arc center.")
+            dx0 = start_position_linear_axes[0] - arc_center[0]
+            dy0 = start_position_linear_axes[1] - arc_center[1]
+            dx1 = end_position_linear_axes[0] - arc_center[0]
+            dy1 = end_position_linear_axes[1] - arc_center[1]
+            self.radius = math.sqrt(dx0 * dx0 + dy0 * dy0)
+            self.start_angle = math.atan2(dy0, dx0)
+            end_angle = math.atan2(dy1, dx1)
+            delta = end_angle - self.start_angle
+            if movement_type == 2:  # clockwise: sweep negative
+                if delta >= 0.0:
+                    delta -= 2.0 * math.pi
+            else:  # counterclockwise: sweep positive
+                if delta <= 0.0:
+                    delta += 2.0 * math.pi
+            self.delta_angle = delta
+
+    def get_position_in_movement(self, time_in_movement: float) -> np.ndarray:
+        """Interpolate the tool position ``time_in_movement`` ms in."""
+        if self.duration <= 0.0:
+            return self.end_position_linear_axes
+
+        fraction = time_in_movement / self.duration
+        start = self.start_position_linear_axes
+        end = self.end_position_linear_axes
+
+        if self.movement_type in (2, 3):
+            angle = self.start_angle + fraction * self.delta_angle
+            position = np.empty(3)
+            position[0] = self.arc_center[0] + self.radius * math.cos(angle)
+            position[1] = self.arc_center[1] + self.radius * math.sin(angle)
+            position[2] = start[2] + fraction * (end[2] - start[2])
+            return position
+
+        return start + fraction * (end - start)
+
+
+class MovementManager:
+    """Owns the movement timeline and answers position queries."""
+
+    def __init__(self, movements: list[Movement]) -> None:
+        self.movements: list[Movement] = movements
+        self.end_times: list[float] = [
+            movement.start_time + movement.duration for movement in movements
+        ]
+        self.total_time: float = self.end_times[-1] if movements else 0.0
+        self._segment_cache: dict[str, np.ndarray] | None = None
+
+    def get_tool_path_information(self, time_ms: float) -> ToolPathInformation:
+        """Return position and G-code context at ``time_ms``."""
+        if not self.movements:
+            raise Exception("No movements available.")
+        if time_ms < 0.0 or time_ms > self.total_time:
+            raise Exception(f"Time {time_ms} ms outside of the program.")
+
+        index = bisect.bisect_left(self.end_times, time_ms)
+        if index >= len(self.movements):
+            index = len(self.movements) - 1
+        movement = self.movements[index]
+
+        information = ToolPathInformation()
+        information.g_code_line_index = movement.g_code_line_index
+        information.movement_type = movement.movement_type
+        information.position_linear_axes = movement.get_position_in_movement(
+            time_ms - movement.start_time
+        )
+        return information
+
+    def _get_segment_arrays(self) -> dict[str, np.ndarray]:
+        """Movement segments packed as SoA arrays, built once."""
+        if self._segment_cache is None:
+            movements = self.movements
+            start = np.array(
+                [m.start_position_linear_axes for m in movements], dtype=np.float64
+            )
+            end = np.array(
+                [m.end_position_linear_axes for m in movements], dtype=np.float64
+            )
+            self._segment_cache = {
+                "t0": np.array([m.start_time for m in movements]),
+                "t1": np.asarray(self.end_times, dtype=np.float64),
+                "duration": np.array([m.duration for m in movements]),
+                "mtype": np.array(
+                    [m.movement_type for m in movements], dtype=np.int8
+                ),
+                "line": np.array(
+                    [m.g_code_line_index for m in movements], dtype=np.int32
+                ),
+                "start": start,
+                "delta": end - start,
+                "cx": np.array(
+                    [
+                        0.0 if m.arc_center is None else m.arc_center[0]
+                        for m in movements
+                    ]
+                ),
+                "cy": np.array(
+                    [
+                        0.0 if m.arc_center is None else m.arc_center[1]
+                        for m in movements
+                    ]
+                ),
+                "radius": np.array([m.radius for m in movements]),
+                "theta0": np.array([m.start_angle for m in movements]),
+                "dtheta": np.array([m.delta_angle for m in movements]),
+            }
+        return self._segment_cache
+
+    def get_tool_path_information_batch(
+        self, times: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized :meth:`get_tool_path_information` over many times.
+
+        Maps every query time onto its movement segment with a single
+        ``np.searchsorted`` sweep and evaluates the segment kinematics
+        in vectorized form (linear interpolation for G0/G1, parametric
+        circle evaluation for G2/G3).  Returns ``(line_index,
+        positions, movement_type)`` where ``positions`` has shape
+        ``(len(times), 3)``.
+        """
+        if not self.movements:
+            raise Exception("No movements available.")
+        segments = self._get_segment_arrays()
+
+        times = np.asarray(times, dtype=np.float64)
+
+        if _toolpath_kernels is not None:
+            positions = np.empty((len(times), 3))
+            line_index = np.empty(len(times), dtype=np.int32)
+            movement_type = np.empty(len(times), dtype=np.int8)
+            if len(times) >= _toolpath_kernels.PARALLEL_THRESHOLD:
+                kernel = _toolpath_kernels.eval_positions_parallel
+            else:
+                kernel = _toolpath_kernels.eval_positions
+            kernel(
+                times,
+                segments["t1"],
+                segments["t0"],
+                segments["duration"],
+                segments["mtype"],
+                segments["start"],
+                segments["delta"],
+                segments["cx"],
+                segments["cy"],
+                segments["radius"],
+                segments["theta0"],
+                segments["dtheta"],
+                segments["line"],
+                positions,
+                line_index,
+                movement_type,
+            )
+            return line_index, positions, movement_type
+
+        indices = np.searchsorted(segments["t1"], times)
+        indices = np.minimum(indices, len(self.movements) - 1)
+
+        duration = segments["duration"][indices]
+        fraction = np.ones(len(times))
+        valid = duration > 0.0
+        np.divide(
+            times - segments["t0"][indices],
+            duration,
+            out=fraction,
+            where=valid,
+        )
+
+        positions = (
+            segments["start"][indices]
+            + fraction[:, None] * segments["delta"][indices]
+        )
+
+        movement_type = segments["mtype"][indices]
+        arc = movement_type >= 2
+        if arc.any():
+            arc_indices = indices[arc]
+            angle = (
+                segments["theta0"][arc_indices]
+                + fraction[arc] * segments["dtheta"][arc_indices]
+            )
+            radius = segments["radius"][arc_indices]
+            positions[arc, 0] = segments["cx"][arc_indices] + radius * np.cos(
+                angle
+            )
+            positions[arc, 1] = segments["cy"][arc_indices] + radius * np.sin(
+                angle
+            )
+
+        return segments["line"][indices], positions, movement_type
+
+    def get_time_stamps(self) -> list[tuple[int, float]]:
+        """Start time of every movement, keyed by G-code line index."""
+        return [
+            (movement.g_code_line_index, movement.start_time)
+            for movement in self.movements
+        ]
@@ -0,0 +1,72 @@
+"""Synthetic test tones for the audio analyser."""
+
+import functools
+
+import numpy as np
+
+SR = 44100
+
+# PCG64 generator: roughly twice as fast as the legacy global
+# RandomState for uniform sampling and independent per instance.
+_RNG = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=32)
+def _t_cache(duration: float, nsamples: int) -> np.ndarray:
+    """Time axis shared across generators.
+
+    The same durations recur across the generated tone sets, so the
+    linspace fill is paid once per distinct (duration, nsamples) pair.
+    Read-only, because every cache hit hands out the same array.
+    """
+    t = np.linspace(0.0, duration, nsamples)
+    t.setflags(write=False)
+    return t
+
+
+def _t(duration: float) -> np.ndarray:
+    return _t_cache(duration, int(SR * duration))
+
+
+def gen_sine_wave(freq: float, duration: float) -> np.ndarray:
+    return np.sin(2.0 * np.pi * freq * _t(duration))
+
+
+def gen_sawtooth_wave(freq: float, duration: float) -> np.ndarray:
+    # The first multiply allocates the result; everything after mutates
+    # that buffer instead of producing one temporary per pass.
+    y = _t(duration) * freq
+    y -= np.floor(y)
+    y *= 2.0
+    y -= 1.0
+    return y
+
+
+def gen_square_wave(freq: float, duration: float) -> np.ndarray:
+    s = np.sin(2.0 * np.pi * freq * _t(duration))
+    np.sign(s, out=s)
+    s *= 2.0
+    return s
+
+
+def gen_triangle_wave(freq: float, duration: float) -> np.ndarray:
+    y = _t(duration) * freq
+    y -= np.floor(y + 0.5)
+    np.abs(y, out=y)
+    y *= 4.0
+    y -= 1.0
+    return y
+
+
+def gen_chirp_wave(
+    freq_start: float, freq_end: float, duration: float
+) -> np.ndarray:
+    t = _t(duration)
+    rate = (freq_end - freq_start) / duration
+    phase = 2.0 * np.pi * (freq_start + 0.5 * rate * t) * t
+    return np.sin(phase)
+
+
+def gen_white_noise(duration: float, seed: int | None = None) -> np.ndarray:
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    return rng.uniform(-1.0, 1.0, int(SR * duration))
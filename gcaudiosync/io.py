@@ -0,0 +1,45 @@
+"""Sound-file input for the synchronisation pipeline."""
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.io import wavfile
+
+
+@dataclass(frozen=True)
+class SoundData:
+    """Samplerate and samples of one recording.
+
+    ``data`` may be a read-only memory map of the file on disk; callers
+    must treat it as immutable and copy before mutating.
+    """
+
+    samplerate: int
+    data: np.ndarray
+
+    def __post_init__(self) -> None:
+        # Downstream FFTs only hit their fast path on contiguous input;
+        # catch accidental strided views at construction time.
+        assert self.data.flags.c_contiguous, "SoundData requires contiguous samples."
+
+    def split_at_indices(self, indices: list[int]) -> list["SoundData"]:
+        """Split the samples at ``indices``; the parts are zero-copy
+        views into ``data``."""
+        return [
+            SoundData(self.samplerate, part)
+            for part in np.split(self.data, indices)
+        ]
+
+
+def read_wav_file(file_path) -> SoundData:
+    """Read a WAV file as a memory-mapped :class:`SoundData`.
+
+    ``mmap=True`` avoids loading the whole file into RAM: samples are
+    paged in on access, which makes opening large recordings instant
+    and allows files bigger than memory.
+    """
+    samplerate, data = wavfile.read(file_path, mmap=True)
+    # No-copy for the common case (the mmap is already contiguous);
+    # guarantees downstream FFTs never pay a hidden contiguity copy.
+    data = np.ascontiguousarray(data)
+    return SoundData(samplerate=samplerate, data=data)